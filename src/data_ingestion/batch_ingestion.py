@@ -0,0 +1,112 @@
+# src/data_ingestion/batch_ingestion.py
+
+import glob
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional
+
+from src.data_ingestion.ingestion_cache import IngestionCache
+from src.data_ingestion.metadata_extractor import MetadataExtractor
+from src.data_ingestion.pdf_processor import PDFProcessor, open_pdf
+
+
+# Cache namespace for results that include MetadataExtractor output
+CACHE_KIND = 'ingest'
+
+
+class IngestionResult(NamedTuple):
+    path: str
+    text: Optional[str]
+    metadata: Optional[Dict[str, Any]]
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def discover_pdfs(source: str) -> Iterator[str]:
+    """
+    Resolve a directory, glob pattern or single file into PDF paths.
+
+    :param source: A directory (searched recursively), a glob pattern or a file path
+    :return: An iterator of matching file paths
+    """
+    if os.path.isdir(source):
+        for root, _, files in os.walk(source):
+            for name in sorted(files):
+                if name.lower().endswith('.pdf'):
+                    yield os.path.join(root, name)
+    elif glob.has_magic(source):
+        yield from glob.iglob(source, recursive=True)
+    else:
+        yield source
+
+
+def ingest_file(pdf_path: str) -> IngestionResult:
+    """
+    Extract text and metadata from one PDF, capturing failures in the result.
+    """
+    try:
+        # Parse once and share the document so each page is extracted at most once
+        with open_pdf(pdf_path) as document:
+            text = PDFProcessor(document).extract_text()
+            metadata = MetadataExtractor(document).extract_metadata()
+        return IngestionResult(pdf_path, text, metadata)
+    except Exception as e:
+        return IngestionResult(pdf_path, None, None, f"{type(e).__name__}: {str(e)}")
+
+
+def ingest_pdfs(source: Any, max_workers: Optional[int] = None,
+                max_pending: Optional[int] = None,
+                cache: Optional[IngestionCache] = None) -> Iterator[IngestionResult]:
+    """
+    Ingest many PDFs in parallel across a process pool.
+
+    Results are yielded in completion order. A failing file produces a result
+    with ``error`` set instead of aborting the whole batch. When a cache is
+    given, unchanged files are served from it without being sent to a worker.
+
+    :param source: A directory, glob pattern, or an iterable of file paths
+    :param max_workers: Number of worker processes (default: CPU count)
+    :param max_pending: Maximum number of files queued at once (default: 4 per worker)
+    :param cache: Optional IngestionCache consulted before parsing and filled afterwards
+    :return: An iterator of IngestionResult
+    """
+    paths: Iterable[str] = discover_pdfs(source) if isinstance(source, str) else source
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max_pending or max_workers * 4
+
+    def collect(done) -> Iterator[IngestionResult]:
+        for future in done:
+            result = future.result()
+            if cache is not None and result.ok:
+                cache.put_result(result.path, result.text, result.metadata, kind=CACHE_KIND)
+            yield result
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for path in paths:
+            if cache is not None:
+                cached = _lookup(cache, path)
+                if cached is not None:
+                    yield cached
+                    continue
+            pending.add(executor.submit(ingest_file, path))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from collect(done)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from collect(done)
+
+
+def _lookup(cache: IngestionCache, pdf_path: str) -> Optional[IngestionResult]:
+    try:
+        cached = cache.get_result(pdf_path, kind=CACHE_KIND)
+    except OSError:
+        # Missing or unreadable files are reported by the worker
+        return None
+    if cached is None:
+        return None
+    return IngestionResult(pdf_path, *cached)
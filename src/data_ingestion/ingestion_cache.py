@@ -0,0 +1,72 @@
+# src/data_ingestion/ingestion_cache.py
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+from src.utils.disk_cache import DiskCache
+
+class IngestionCache(DiskCache):
+    """
+    On-disk cache of extracted text and metadata keyed by file content.
+
+    Results are stored under the SHA-256 of the PDF bytes. A per-path record
+    of (mtime, size, digest) lets unchanged files skip hashing entirely, so
+    re-ingesting an unchanged library only costs a stat and a lookup per file.
+    """
+
+    def __init__(self, path: str = 'data/ingestion_cache.sqlite', max_bytes: int = 2 * 1024 ** 3):
+        super().__init__(path, max_bytes)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, digest TEXT NOT NULL)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def hash_file(pdf_path: str, block_size: int = 1024 * 1024) -> str:
+        digest = hashlib.sha256()
+        with open(pdf_path, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def file_digest(self, pdf_path: str) -> str:
+        """
+        Get the content hash of a file, reusing the stored one if mtime and size are unchanged.
+        """
+        path = os.path.abspath(pdf_path)
+        stat = os.stat(path)
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT mtime_ns, size, digest FROM files WHERE path = ?", (path,)
+            ).fetchone()
+        if row and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+            return row[2]
+
+        digest = self.hash_file(path)
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO files (path, mtime_ns, size, digest) VALUES (?, ?, ?, ?)",
+                (path, stat.st_mtime_ns, stat.st_size, digest),
+            )
+            self.conn.commit()
+        return digest
+
+    def get_result(self, pdf_path: str, kind: str = 'pdf') -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Look up the cached (text, metadata) for a file.
+
+        :param pdf_path: Path to the PDF
+        :param kind: Namespace for the cached result, so different extraction paths don't collide
+        :return: The cached (text, metadata), or None on a miss
+        """
+        value = self.get(f"{kind}:{self.file_digest(pdf_path)}")
+        if value is None:
+            return None
+        entry = json.loads(value)
+        return entry['text'], entry['metadata']
+
+    def put_result(self, pdf_path: str, text: str, metadata: Dict[str, Any], kind: str = 'pdf') -> None:
+        value = json.dumps({'text': text, 'metadata': metadata}, default=str).encode('utf-8')
+        self.set(f"{kind}:{self.file_digest(pdf_path)}", value)
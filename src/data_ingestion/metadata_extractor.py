@@ -1,78 +1,122 @@
 # src/data_ingestion/metadata_extractor.py
 
-import PyPDF2
-from typing import Dict, Any, Optional, BinaryIO
+from typing import Dict, Any, Optional, BinaryIO, Union
 import re
 from datetime import datetime
+from src.data_ingestion.pdf_document import PDFDocument
+
+_ABSTRACT_PATTERN = re.compile(r'(?i)abstract\s*(.*?)\n\n', re.DOTALL)
+
+# Date, DOI and keywords are found in one scan of the first page. Each field
+# is a zero-width lookahead so matches never consume text another field may
+# need, and the alternatives can't start at the same position (digit vs
+# "10." vs "k"), so the first hit per field equals a separate re.search.
+# The leading character class lets the engine skip most positions cheaply.
+_FIRST_PAGE_FIELDS_PATTERN = re.compile(
+    r'(?=[0-9Kk])(?:'
+    r'(?=(?P<date>\d{4}-\d{2}-\d{2}))'
+    r'|(?=(?P<doi>\b10\.\d{4,}(?:\.\d+)*\/\S+\b))'
+    r'|(?=(?i:keywords?):?\s*(?P<keywords>.*?)(?:\n\n|\Z))'
+    r')',
+    re.DOTALL,
+)
+_FIRST_PAGE_FIELDS = ('date', 'doi', 'keywords')
 
 class MetadataExtractor:
-    def __init__(self, pdf_file: BinaryIO):
+    def __init__(self, pdf_file: Union[BinaryIO, PDFDocument]):
         self.pdf_file = pdf_file
 
     def extract_metadata(self) -> Dict[str, Any]:
-        reader = PyPDF2.PdfReader(self.pdf_file)
-        metadata = reader.metadata
+        # Reuse an already parsed document when one is shared with PDFProcessor
+        if isinstance(self.pdf_file, PDFDocument):
+            document = self.pdf_file
+        else:
+            document = PDFDocument(self.pdf_file)
+        metadata = document.metadata
         
         # Extract text from the first page for additional processing
-        first_page_text = reader.pages[0].extract_text()
+        first_page_text = document.page_text(0)
+        fields = self._scan_first_page(first_page_text)
 
         extracted_metadata = {
-            "title": self._extract_title(metadata, first_page_text),
-            "authors": self._extract_authors(metadata, first_page_text),
-            "publication_date": self._extract_publication_date(metadata, first_page_text),
-            "abstract": self._extract_abstract(reader),
-            "keywords": self._extract_keywords(first_page_text),
-            "doi": self._extract_doi(first_page_text),
+            "title": self._extract_title(metadata, fields),
+            "authors": self._extract_authors(metadata, fields),
+            "publication_date": self._extract_publication_date(metadata, fields),
+            "abstract": self._extract_abstract(document),
+            "keywords": self._extract_keywords(fields),
+            "doi": self._extract_doi(fields),
         }
 
         return extracted_metadata
 
+    @staticmethod
+    def _scan_first_page(first_page_text: str) -> Dict[str, Optional[str]]:
+        """
+        Collect the raw first-page fields in a single pass over the text.
+
+        :param first_page_text: Text of the first page
+        :return: A dictionary with the title line, author line, date, DOI and keywords
+        """
+        # The first line is the title candidate, the first complete line after
+        # it the author candidate; both only need the first two line breaks
+        lines = first_page_text.split('\n', 2)
+        fields: Dict[str, Optional[str]] = {
+            "title": lines[0],
+            "authors": lines[1] if len(lines) == 3 else None,
+            "date": None,
+            "doi": None,
+            "keywords": None,
+        }
+
+        missing = set(_FIRST_PAGE_FIELDS)
+        for match in _FIRST_PAGE_FIELDS_PATTERN.finditer(first_page_text):
+            field = match.lastgroup
+            if field in missing:
+                fields[field] = match.group(field)
+                missing.discard(field)
+                if not missing:
+                    break
+        return fields
 
-    def _extract_title(self, metadata: Dict[str, Any], first_page_text: str) -> str:
+    def _extract_title(self, metadata: Dict[str, Any], fields: Dict[str, Optional[str]]) -> str:
         if metadata.get('/Title'):
             return metadata['/Title']
         # Fallback: Try to extract title from the first page text
         # This is a simple heuristic and might need refinement
-        lines = first_page_text.split('\n')
-        return lines[0] if lines else "Unknown Title"
+        return fields["title"]
 
-    def _extract_authors(self, metadata: Dict[str, Any], first_page_text: str) -> list:
+    def _extract_authors(self, metadata: Dict[str, Any], fields: Dict[str, Optional[str]]) -> list:
         if metadata.get('/Author'):
             return [author.strip() for author in metadata['/Author'].split(',')]
         # Fallback: Try to extract authors from the first page text
         # This is a simple heuristic and might need refinement
-        author_line = re.search(r'(?<=\n).*?(?=\n)', first_page_text)
-        if author_line:
-            return [author.strip() for author in author_line.group().split(',')]
+        if fields["authors"] is not None:
+            return [author.strip() for author in fields["authors"].split(',')]
         return ["Unknown Author"]
 
-    def _extract_publication_date(self, metadata: Dict[str, Any], first_page_text: str) -> Optional[str]:
+    def _extract_publication_date(self, metadata: Dict[str, Any], fields: Dict[str, Optional[str]]) -> Optional[str]:
         if metadata.get('/CreationDate'):
             # Parse the date string from metadata
             date_str = metadata['/CreationDate'][2:10]  # Format: 'D:YYYYMMDD'
             return datetime.strptime(date_str, '%Y%m%d').strftime('%Y-%m-%d')
-        # Fallback: Try to find a date in the first page text
-        date_match = re.search(r'\d{4}-\d{2}-\d{2}', first_page_text)
-        return date_match.group() if date_match else None
+        # Fallback: Use the first date found in the first page text
+        return fields["date"]
 
-    def _extract_abstract(self, reader: PyPDF2.PdfReader) -> Optional[str]:
+    def _extract_abstract(self, document: PDFDocument) -> Optional[str]:
         # Simple heuristic: Look for "Abstract" and extract the following paragraph
-        for page in reader.pages[:3]:  # Check first 3 pages
-            text = page.extract_text()
-            abstract_match = re.search(r'(?i)abstract\s*(.*?)\n\n', text, re.DOTALL)
+        for index in range(min(3, len(document))):  # Check first 3 pages
+            text = document.page_text(index)
+            abstract_match = _ABSTRACT_PATTERN.search(text)
             if abstract_match:
                 return abstract_match.group(1).strip()
         return None
 
-    def _extract_keywords(self, first_page_text: str) -> list:
-        # Look for keywords section
-        keyword_match = re.search(r'(?i)keywords?:?\s*(.*?)(?:\n\n|\Z)', first_page_text, re.DOTALL)
-        if keyword_match:
-            keywords = keyword_match.group(1)
-            return [kw.strip() for kw in keywords.split(',')]
+    def _extract_keywords(self, fields: Dict[str, Optional[str]]) -> list:
+        # Use the keywords section, if any
+        if fields["keywords"] is not None:
+            return [kw.strip() for kw in fields["keywords"].split(',')]
         return []
 
-    def _extract_doi(self, first_page_text: str) -> Optional[str]:
-        doi_match = re.search(r'\b(10\.\d{4,}(?:\.\d+)*\/\S+)\b', first_page_text)
-        return doi_match.group() if doi_match else None
+    def _extract_doi(self, fields: Dict[str, Optional[str]]) -> Optional[str]:
+        return fields["doi"]
 
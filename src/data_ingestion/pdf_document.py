@@ -0,0 +1,51 @@
+# src/data_ingestion/pdf_document.py
+
+import PyPDF2
+from typing import Any, BinaryIO, Dict, Iterator, Tuple
+
+class PDFDocument:
+    """
+    A parsed PDF shared by PDFProcessor and MetadataExtractor.
+
+    The file is parsed once and page text is extracted lazily. Pages read by
+    random access (page_text) are cached; sequential iteration (iter_pages)
+    only keeps the first ``cached_pages`` pages, which covers the pages the
+    metadata heuristics look at without holding the whole document in memory.
+    """
+
+    def __init__(self, pdf_file: BinaryIO, cached_pages: int = 3):
+        self.pdf_file = pdf_file
+        self.reader = PyPDF2.PdfReader(self.pdf_file)
+        self.cached_pages = cached_pages
+        self._page_text: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.reader.pages)
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.reader.metadata
+
+    def page_text(self, index: int) -> str:
+        """
+        Get the extracted text of a page, extracting it at most once.
+
+        :param index: Zero-based page index
+        :return: The page text
+        """
+        if index not in self._page_text:
+            self._page_text[index] = self.reader.pages[index].extract_text()
+        return self._page_text[index]
+
+    def iter_pages(self) -> Iterator[Tuple[int, str]]:
+        """
+        Iterate over (page_number, text) pairs, page numbers starting at 1.
+        """
+        for index, page in enumerate(self.reader.pages):
+            if index in self._page_text:
+                text = self._page_text[index]
+            else:
+                text = page.extract_text()
+                if index < self.cached_pages:
+                    self._page_text[index] = text
+            yield index + 1, text
@@ -1,17 +1,29 @@
-import PyPDF2
+import os
+from contextlib import contextmanager
 from PyPDF2.errors import PdfReadError
-from typing import BinaryIO, Dict, Any
+from typing import BinaryIO, Dict, Any, Iterator, Optional, Tuple, Union
+from src.data_ingestion.pdf_document import PDFDocument
+from src.data_ingestion.ingestion_cache import IngestionCache
 
 class PDFProcessor:
-    def __init__(self, pdf_file: BinaryIO):
-        self.pdf_file = pdf_file
-        self.reader = PyPDF2.PdfReader(self.pdf_file)
+    def __init__(self, pdf_file: Union[BinaryIO, PDFDocument]):
+        if isinstance(pdf_file, PDFDocument):
+            self.document = pdf_file
+        else:
+            self.document = PDFDocument(pdf_file)
+        self.pdf_file = self.document.pdf_file
+        self.reader = self.document.reader
+
+    def iter_pages(self) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily extract text one page at a time.
+
+        :return: An iterator of (page_number, text) pairs, page numbers starting at 1
+        """
+        return self.document.iter_pages()
 
     def extract_text(self) -> str:
-        text = ""
-        for page in self.reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        return "".join(f"{text}\n" for _, text in self.iter_pages())
 
     def get_metadata(self) -> Dict[str, Any]:
         metadata = self.reader.metadata
@@ -24,16 +36,47 @@ class PDFProcessor:
         }
 
 
-def process_pdf(pdf_path: str) -> tuple[str, Dict[str, Any]]:
+@contextmanager
+def open_pdf(pdf_path: str) -> Iterator[PDFDocument]:
+    """
+    Open and parse a PDF once so several consumers can share it.
+
+    Errors raised while opening or reading the document are mapped to the
+    same exception types as process_pdf.
+    """
     try:
         with open(pdf_path, 'rb') as file:
-            processor = PDFProcessor(file)
-            text = processor.extract_text()
-            metadata = processor.get_metadata()
-        return text, metadata
+            yield PDFDocument(file)
     except FileNotFoundError:
         raise FileNotFoundError(f"The file {pdf_path} does not exist.")
     except PdfReadError:
         raise ValueError(f"The file {pdf_path} is not a valid PDF.")
     except Exception as e:
-        raise RuntimeError(f"An error occurred while processing {pdf_path}: {str(e)}")
\ No newline at end of file
+        raise RuntimeError(f"An error occurred while processing {pdf_path}: {str(e)}")
+
+
+def process_pdf(pdf_path: str, cache: Optional[IngestionCache] = None) -> tuple[str, Dict[str, Any]]:
+    if cache is not None and os.path.exists(pdf_path):
+        cached = cache.get_result(pdf_path)
+        if cached is not None:
+            return cached
+
+    with open_pdf(pdf_path) as document:
+        processor = PDFProcessor(document)
+        text = processor.extract_text()
+        metadata = processor.get_metadata()
+
+    if cache is not None:
+        cache.put_result(pdf_path, text, metadata)
+    return text, metadata
+
+
+def stream_pdf(pdf_path: str) -> Iterator[Tuple[int, str]]:
+    """
+    Streaming variant of process_pdf: yield (page_number, text) pairs while the
+    file is open, so only the current page's text is held in memory.
+
+    Errors are mapped to the same exception types as process_pdf.
+    """
+    with open_pdf(pdf_path) as document:
+        yield from PDFProcessor(document).iter_pages()
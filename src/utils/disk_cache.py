@@ -0,0 +1,94 @@
+# src/utils/disk_cache.py
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+
+class DiskCache:
+    """
+    A size-bounded key/value cache of compressed blobs stored in SQLite.
+
+    Entries are evicted least-recently-used first once the total compressed
+    size exceeds ``max_bytes``. Safe to share between threads.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 2 * 1024 ** 3, compression_level: int = 6):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self.conn.commit()
+        self._total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+            self.conn.commit()
+        return zlib.decompress(row[0])
+
+    def set(self, key: str, value: bytes) -> None:
+        blob = zlib.compress(value, self.compression_level)
+        with self._lock:
+            previous = self.conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), time.time()),
+            )
+            self._total_bytes += len(blob) - (previous[0] if previous else 0)
+            self._evict()
+            self.conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            row = self.conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            if row:
+                self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._total_bytes -= row[0]
+                self.conn.commit()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _evict(self) -> None:
+        # Called with the lock held; drops the least recently used entries
+        while self._total_bytes > self.max_bytes:
+            rows = self.conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._total_bytes -= size
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
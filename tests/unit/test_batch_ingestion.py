@@ -0,0 +1,73 @@
+# tests/unit/test_batch_ingestion.py
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from PyPDF2 import PdfWriter
+from src.data_ingestion.batch_ingestion import discover_pdfs, ingest_file, ingest_pdfs
+from src.data_ingestion.ingestion_cache import IngestionCache
+
+
+def write_blank_pdf(path, pages=1):
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=200, height=200)
+    with open(path, 'wb') as f:
+        writer.write(f)
+
+
+class TestBatchIngestion(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = self.tmp_dir.name
+        os.makedirs(os.path.join(self.root, 'nested'))
+        write_blank_pdf(os.path.join(self.root, 'a.pdf'))
+        write_blank_pdf(os.path.join(self.root, 'nested', 'b.pdf'), pages=2)
+        with open(os.path.join(self.root, 'broken.pdf'), 'wb') as f:
+            f.write(b'Not a PDF')
+        with open(os.path.join(self.root, 'notes.txt'), 'w') as f:
+            f.write('ignored')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_discover_pdfs_directory(self):
+        paths = sorted(os.path.relpath(p, self.root) for p in discover_pdfs(self.root))
+        self.assertEqual(paths, ['a.pdf', 'broken.pdf', os.path.join('nested', 'b.pdf')])
+
+    def test_discover_pdfs_glob(self):
+        paths = list(discover_pdfs(os.path.join(self.root, '*.pdf')))
+        self.assertEqual(len(paths), 2)
+
+    def test_ingest_file_captures_errors(self):
+        result = ingest_file(os.path.join(self.root, 'broken.pdf'))
+        self.assertFalse(result.ok)
+        self.assertIsNone(result.text)
+        self.assertIn('ValueError', result.error)
+
+    def test_ingest_pdfs(self):
+        results = {os.path.basename(r.path): r for r in ingest_pdfs(self.root, max_workers=2)}
+
+        self.assertEqual(set(results), {'a.pdf', 'b.pdf', 'broken.pdf'})
+        self.assertTrue(results['a.pdf'].ok)
+        self.assertEqual(results['b.pdf'].text.count('\n'), 2)
+        self.assertIn('authors', results['b.pdf'].metadata)
+        self.assertFalse(results['broken.pdf'].ok)
+
+    def test_ingest_pdfs_skips_cached_files(self):
+        cache = IngestionCache(os.path.join(self.root, 'cache', 'ingest.sqlite'))
+        first = list(ingest_pdfs(self.root, max_workers=2, cache=cache))
+
+        with patch('src.data_ingestion.batch_ingestion.ProcessPoolExecutor') as mock_executor:
+            second = list(ingest_pdfs(self.root, max_workers=2, cache=cache))
+        cache.close()
+
+        submit = mock_executor.return_value.__enter__.return_value.submit
+        self.assertEqual(submit.call_count, 1)  # only the broken file is retried
+        cached = {os.path.basename(r.path): r for r in second if r.ok}
+        self.assertEqual(set(cached), {'a.pdf', 'b.pdf'})
+        self.assertEqual(len([r for r in first if r.ok]), 2)
+
+if __name__ == '__main__':
+    unittest.main()
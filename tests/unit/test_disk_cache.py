@@ -0,0 +1,60 @@
+# tests/unit/test_disk_cache.py
+
+import os
+import tempfile
+import unittest
+from src.utils.disk_cache import DiskCache
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'cache.sqlite')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_set_and_get(self):
+        cache = DiskCache(self.path)
+        cache.set('key', b'value' * 100)
+
+        self.assertEqual(cache.get('key'), b'value' * 100)
+        self.assertIsNone(cache.get('missing'))
+        self.assertIn('key', cache)
+        cache.close()
+
+    def test_persists_across_instances(self):
+        cache = DiskCache(self.path)
+        cache.set('key', b'value')
+        cache.close()
+
+        reopened = DiskCache(self.path)
+        self.assertEqual(reopened.get('key'), b'value')
+        self.assertGreater(reopened.total_bytes, 0)
+        reopened.close()
+
+    def test_evicts_least_recently_used(self):
+        cache = DiskCache(self.path, max_bytes=10 ** 6)
+        blob_size = len(__import__('zlib').compress(os.urandom(400)))
+        cache.max_bytes = blob_size * 2
+        cache.set('a', os.urandom(400))
+        cache.set('b', os.urandom(400))
+        cache.get('a')
+        cache.set('c', os.urandom(400))
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertLessEqual(cache.total_bytes, cache.max_bytes)
+        cache.close()
+
+    def test_delete(self):
+        cache = DiskCache(self.path)
+        cache.set('key', b'value')
+        cache.delete('key')
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.total_bytes, 0)
+        cache.close()
+
+if __name__ == '__main__':
+    unittest.main()
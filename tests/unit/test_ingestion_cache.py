@@ -0,0 +1,52 @@
+# tests/unit/test_ingestion_cache.py
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.data_ingestion.ingestion_cache import IngestionCache
+from src.data_ingestion.pdf_processor import process_pdf
+
+class TestIngestionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = IngestionCache(os.path.join(self.tmp_dir.name, 'cache.sqlite'))
+        self.pdf_path = os.path.join(self.tmp_dir.name, 'paper.pdf')
+        with open(self.pdf_path, 'wb') as f:
+            f.write(b'%PDF-1.3 (mock PDF content)')
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        self.assertIsNone(self.cache.get_result(self.pdf_path))
+        self.cache.put_result(self.pdf_path, 'text', {'title': 'Cached'})
+
+        self.assertEqual(self.cache.get_result(self.pdf_path), ('text', {'title': 'Cached'}))
+        self.assertIsNone(self.cache.get_result(self.pdf_path, kind='other'))
+
+    def test_unchanged_file_is_not_rehashed(self):
+        self.cache.file_digest(self.pdf_path)
+        with patch.object(IngestionCache, 'hash_file') as mock_hash:
+            self.cache.file_digest(self.pdf_path)
+        mock_hash.assert_not_called()
+
+    def test_changed_file_is_a_miss(self):
+        self.cache.put_result(self.pdf_path, 'text', {})
+        with open(self.pdf_path, 'ab') as f:
+            f.write(b' changed')
+
+        self.assertIsNone(self.cache.get_result(self.pdf_path))
+
+    def test_process_pdf_uses_cache(self):
+        self.cache.put_result(self.pdf_path, 'cached text', {'title': 'Cached'})
+        with patch('PyPDF2.PdfReader') as mock_pdf_reader:
+            text, metadata = process_pdf(self.pdf_path, cache=self.cache)
+
+        mock_pdf_reader.assert_not_called()
+        self.assertEqual(text, 'cached text')
+        self.assertEqual(metadata['title'], 'Cached')
+
+if __name__ == '__main__':
+    unittest.main()
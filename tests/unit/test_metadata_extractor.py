@@ -76,5 +76,16 @@ class TestMetadataExtractor(unittest.TestCase):
         metadata = self.extractor.extract_metadata()
         self.assertEqual(metadata['doi'], '10.1234/abcd.5678')
 
+    def test_scan_first_page_single_pass(self):
+        text = ("A Title\nJohn Doe, Jane Smith\nKeywords: AI, NLP\n\n"
+                "Published 2021-03-04\nDOI: 10.1234/2020-01-01.x")
+        fields = MetadataExtractor._scan_first_page(text)
+
+        self.assertEqual(fields['title'], 'A Title')
+        self.assertEqual(fields['authors'], 'John Doe, Jane Smith')
+        self.assertEqual(fields['keywords'], 'AI, NLP')
+        self.assertEqual(fields['date'], '2021-03-04')
+        self.assertEqual(fields['doi'], '10.1234/2020-01-01.x')
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
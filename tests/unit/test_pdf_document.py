@@ -0,0 +1,52 @@
+# tests/unit/test_pdf_document.py
+
+import unittest
+from unittest.mock import patch, MagicMock
+from io import BytesIO
+from src.data_ingestion.pdf_document import PDFDocument
+from src.data_ingestion.pdf_processor import PDFProcessor
+from src.data_ingestion.metadata_extractor import MetadataExtractor
+
+class TestPDFDocument(unittest.TestCase):
+    def setUp(self):
+        self.pages = [MagicMock() for _ in range(5)]
+        for i, page in enumerate(self.pages):
+            page.extract_text.return_value = f"Page {i + 1}\nAbstract\nText {i + 1}.\n\n"
+        self.mock_reader = MagicMock()
+        self.mock_reader.pages = self.pages
+        self.mock_reader.metadata = {'/Title': 'Shared'}
+
+    @patch('PyPDF2.PdfReader')
+    def test_page_text_is_cached(self, mock_pdf_reader):
+        mock_pdf_reader.return_value = self.mock_reader
+        document = PDFDocument(BytesIO(b"%PDF"))
+
+        self.assertEqual(document.page_text(1), document.page_text(1))
+        self.pages[1].extract_text.assert_called_once()
+
+    @patch('PyPDF2.PdfReader')
+    def test_iter_pages_only_caches_leading_pages(self, mock_pdf_reader):
+        mock_pdf_reader.return_value = self.mock_reader
+        document = PDFDocument(BytesIO(b"%PDF"), cached_pages=2)
+
+        numbers = [number for number, _ in document.iter_pages()]
+
+        self.assertEqual(numbers, [1, 2, 3, 4, 5])
+        self.assertEqual(sorted(document._page_text), [0, 1])
+
+    @patch('PyPDF2.PdfReader')
+    def test_shared_document_parses_once(self, mock_pdf_reader):
+        mock_pdf_reader.return_value = self.mock_reader
+        document = PDFDocument(BytesIO(b"%PDF"))
+
+        text = PDFProcessor(document).extract_text()
+        metadata = MetadataExtractor(document).extract_metadata()
+
+        self.assertIn("Page 5", text)
+        self.assertEqual(metadata['title'], 'Shared')
+        mock_pdf_reader.assert_called_once()
+        for page in self.pages:
+            page.extract_text.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import mock_open, patch
 from io import BytesIO
-from src.data_ingestion.pdf_processor import PDFProcessor, process_pdf
+from src.data_ingestion.pdf_processor import PDFProcessor, process_pdf, stream_pdf
 from PyPDF2.errors import PdfReadError  # Add this import
 
 
@@ -24,6 +24,19 @@ class TestPDFProcessor(unittest.TestCase):
 
         self.assertEqual(text, 'Page 1 content\nPage 2 content\n')
 
+    @patch('PyPDF2.PdfReader')
+    def test_iter_pages(self, mock_pdf_reader):
+        mock_pdf_reader.return_value.pages = [
+            type('MockPage', (), {'extract_text': lambda: 'Page 1 content'}),
+            type('MockPage', (), {'extract_text': lambda: 'Page 2 content'})
+        ]
+
+        with BytesIO(self.mock_pdf_content) as pdf_file:
+            processor = PDFProcessor(pdf_file)
+            pages = processor.iter_pages()
+            self.assertEqual(next(pages), (1, 'Page 1 content'))
+            self.assertEqual(list(pages), [(2, 'Page 2 content')])
+
     @patch('PyPDF2.PdfReader')
     def test_get_metadata(self, mock_pdf_reader):
         # Mock the PdfReader to return predictable metadata
@@ -53,6 +66,26 @@ class TestPDFProcessor(unittest.TestCase):
         self.assertEqual(text, 'Test content\n')
         self.assertEqual(metadata['title'], 'Test PDF')
 
+    @patch('builtins.open', new_callable=mock_open, read_data=b'%PDF-1.3 (mock PDF content)')
+    @patch('PyPDF2.PdfReader')
+    def test_stream_pdf(self, mock_pdf_reader, mock_file):
+        mock_pdf_reader.return_value.pages = [
+            type('MockPage', (), {'extract_text': lambda: 'First'}),
+            type('MockPage', (), {'extract_text': lambda: 'Second'})
+        ]
+
+        pages = list(stream_pdf('fake_path.pdf'))
+
+        self.assertEqual(pages, [(1, 'First'), (2, 'Second')])
+
+    @patch('builtins.open', new_callable=mock_open, read_data=b'Not a PDF')
+    @patch('PyPDF2.PdfReader')
+    def test_stream_pdf_invalid(self, mock_pdf_reader, mock_file):
+        mock_pdf_reader.side_effect = PdfReadError("Invalid PDF")
+
+        with self.assertRaises(ValueError):
+            list(stream_pdf('invalid.pdf'))
+
     def test_file_not_found(self):
         with self.assertRaises(FileNotFoundError):
             process_pdf('non_existent.pdf')